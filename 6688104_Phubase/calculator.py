@@ -1,5 +1,7 @@
 """Simple calculator module with basic arithmetic operations."""
 
+import sys
+
 
 def add(a, b):
     """Add two numbers and return the result."""
@@ -27,8 +29,44 @@ def divide(a, b):
     return a / b
 
 
+# Menu choice -> (display symbol, operation).
+_OPS = {
+    "1": ("+", add),
+    "2": ("-", subtract),
+    "3": ("×", multiply),
+    "4": ("÷", divide),
+}
+
+
+def _batched_input(stream):
+    """Return an input()-like function that reads lines from stream.
+
+    The whole stream is read in one call when the first prompt is shown and
+    then handed out one line per prompt, like input(), so piped or scripted
+    input costs a single read instead of one per prompt.
+
+    Raises:
+        EOFError: From the returned function once the lines run out.
+    """
+    lines = None
+
+    def read(prompt=""):
+        nonlocal lines
+        print(prompt, end="")
+        if lines is None:
+            sys.stdout.flush()
+            lines = iter(stream.read().splitlines())
+        try:
+            return next(lines)
+        except StopIteration:
+            raise EOFError from None
+
+    return read
+
+
 def main():
     """Interactive calculator interface."""
+    read = input if sys.stdin.isatty() else _batched_input(sys.stdin)
     print("Simple Calculator")
     print("-" * 40)
     
@@ -40,33 +78,30 @@ def main():
         print("4. Divide")
         print("5. Exit")
         
-        choice = input("\nEnter choice (1/2/3/4/5): ").strip()
+        choice = read("\nEnter choice (1/2/3/4/5): ").strip()
         
         if choice == "5":
             print("Goodbye!")
             break
         
-        if choice not in ["1", "2", "3", "4"]:
+        if choice not in _OPS:
             print("Invalid choice. Please try again.")
             continue
-        
+
+        symbol, operation = _OPS[choice]
+
         try:
-            num1 = float(input("Enter first number: "))
-            num2 = float(input("Enter second number: "))
-            
-            if choice == "1":
-                print(f"Result: {num1} + {num2} = {add(num1, num2)}")
-            elif choice == "2":
-                print(f"Result: {num1} - {num2} = {subtract(num1, num2)}")
-            elif choice == "3":
-                print(f"Result: {num1} × {num2} = {multiply(num1, num2)}")
-            elif choice == "4":
-                print(f"Result: {num1} ÷ {num2} = {divide(num1, num2)}")
-                
-        except ValueError as e:
-            print(f"Error: {e}")
+            num1 = float(read("Enter first number: "))
+            num2 = float(read("Enter second number: "))
         except ValueError:
             print("Invalid input. Please enter valid numbers.")
+            continue
+
+        if operation is divide and num2 == 0:
+            print("Error: Cannot divide by zero")
+            continue
+
+        print(f"Result: {num1} {symbol} {num2} = {operation(num1, num2)}")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,67 @@
 """Main entry point for the To-Do List CLI application."""
 
+import contextlib
+import hashlib
+import hmac
 import json
 import os
+import sys
 from pathlib import Path
 from typing import Optional
 
+import msgpack
+
+# Raw bytes on Windows, where os.open defaults to text mode; 0 elsewhere.
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+if hasattr(os, "pread"):
+
+    def _read_fd(fd: int, size: int) -> bytes:
+        """Read size bytes from the start of fd in a single call."""
+        return os.pread(fd, size, 0)
+
+else:  # Windows has no pread
+
+    def _read_fd(fd: int, size: int) -> bytes:
+        """Read size bytes from the start of fd."""
+        os.lseek(fd, 0, os.SEEK_SET)
+        return os.read(fd, size)
+
+
+def _hash_password(password: str, salt: bytes) -> bytes:
+    """Derive a password hash with scrypt.
+
+    Args:
+        password: Plaintext password.
+        salt: Random per-user salt.
+
+    Returns:
+        32-byte derived key.
+    """
+    return hashlib.scrypt(password.encode(), salt=salt, n=2**14, r=8, p=1, dklen=32)
+
+
+# Stand-in credentials hashed for failed lookups, so that unknown usernames
+# take as long to reject as wrong passwords.
+_DUMMY_SALT = bytes(16)
+_DUMMY_HASH = bytes(32)
+
+
+# Cursor home, clear screen, clear scrollback.
+_CLEAR_SCREEN = "\x1b[H\x1b[2J\x1b[3J"
+
+_MENU_RULE = "=" * 40
+_PRE_LOGIN_MENU = (
+    f"\n{_MENU_RULE}\n"
+    f"{'  To-Do List Application'.center(40)}\n"
+    f"{_MENU_RULE}\n"
+    "\n[1] Login\n"
+    "[2] Sign Up\n"
+    "[3] Exit\n"
+    f"\n{_MENU_RULE}\n"
+)
+
 
 class AuthManager:
     """Manages user authentication and storage."""
@@ -13,34 +70,127 @@ class AuthManager:
         """Initialize AuthManager.
 
         Args:
-            users_file: Path to the users.json file.
+            users_file: Path to the users file.
         """
         self.users_file = users_file
+        self._users_by_name: Optional[dict[str, dict]] = None
+        self._cache_stat: Optional[tuple] = None
         self._ensure_users_file()
 
     def _ensure_users_file(self) -> None:
-        """Ensure the users.json file exists."""
-        if not os.path.exists(self.users_file):
-            with open(self.users_file, "w") as f:
-                json.dump([], f)
-
-    def _load_users(self) -> list:
-        """Load all users from the file.
+        """Ensure the users file exists, holding an empty user list."""
+        try:
+            fd = os.open(
+                self.users_file,
+                os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_BINARY,
+                0o600,
+            )
+        except FileExistsError:
+            return
+        try:
+            os.write(fd, msgpack.packb([]))
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _key_from_stat(st: os.stat_result) -> tuple:
+        """Return the (inode, mtime, size) triple used to detect changes."""
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _stat_key(self) -> tuple:
+        """Return the change-detection key for users.json on disk."""
+        return self._key_from_stat(os.stat(self.users_file))
+
+    def _load_users(self) -> dict[str, dict]:
+        """Load all users from the file, indexed by username.
+
+        The file is MessagePack-encoded. A legacy JSON file is detected by
+        its leading ``[`` and rewritten as MessagePack on first load; if the
+        file cannot be written, the parsed users are still returned and the
+        next successful save converts it. An empty (or whitespace-only) file
+        is treated as having no users.
+
+        The parsed index is cached and only rebuilt when the file's inode,
+        modification time or size changes. The file is not kept open
+        between loads, because Windows refuses to replace an open file and
+        other instances must still be able to save.
 
         Returns:
-            List of user dictionaries.
+            Dictionary mapping usernames to user dictionaries.
         """
-        with open(self.users_file, "r") as f:
-            return json.load(f)
+        st = os.stat(self.users_file)
+        if (
+            self._users_by_name is not None
+            and self._key_from_stat(st) == self._cache_stat
+        ):
+            return self._users_by_name
+
+        fd = os.open(self.users_file, os.O_RDONLY | _O_BINARY)
+        try:
+            data = _read_fd(fd, st.st_size)
+        finally:
+            os.close(fd)
+        data = data.lstrip()
+        if data[:1] == b"[":
+            users = {user["username"]: user for user in json.loads(data)}
+            try:
+                self._save_users(users)
+            except OSError:
+                pass  # e.g. a read-only checkout; cache against the JSON file
+            else:
+                return users
+        else:
+            records = msgpack.unpackb(data) if data else []
+            users = {user["username"]: user for user in records}
 
-    def _save_users(self, users: list) -> None:
+        self._users_by_name = users
+        self._cache_stat = self._key_from_stat(st)
+        return users
+
+    def _save_users(self, users: dict[str, dict]) -> None:
         """Save users to the file.
 
+        The file keeps its list-of-records format, encoded with MessagePack.
+        Data is written to a temporary file, readable by the owner only,
+        which then replaces the users file atomically. The in-memory cache
+        is only replaced once the new file is in place, so callers must
+        pass a fresh dict rather than mutating the cached one.
+
         Args:
-            users: List of user dictionaries.
+            users: Dictionary mapping usernames to user dictionaries.
         """
-        with open(self.users_file, "w") as f:
-            json.dump(users, f, indent=2)
+        tmp_file = self.users_file + ".tmp"
+        fd = os.open(
+            tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o600
+        )
+        try:
+            with open(fd, "wb") as f:
+                f.write(msgpack.packb(list(users.values())))
+            os.replace(tmp_file, self.users_file)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_file)
+            raise
+        self._users_by_name = users
+        self._cache_stat = self._stat_key()
+
+    @staticmethod
+    def _make_user(username: str, password: str) -> dict:
+        """Build a user record storing a salted password hash.
+
+        Args:
+            username: Username for the record.
+            password: Plaintext password to hash.
+
+        Returns:
+            User dictionary ready to be saved.
+        """
+        salt = os.urandom(16)
+        return {
+            "username": username,
+            "salt": salt.hex(),
+            "hash": _hash_password(password, salt).hex(),
+        }
 
     def user_exists(self, username: str) -> bool:
         """Check if a user exists.
@@ -51,8 +201,7 @@ class AuthManager:
         Returns:
             True if user exists, False otherwise.
         """
-        users = self._load_users()
-        return any(user["username"] == username for user in users)
+        return username in self._load_users()
 
     def authenticate(self, username: str, password: str) -> bool:
         """Authenticate a user.
@@ -61,14 +210,32 @@ class AuthManager:
             username: Username to authenticate.
             password: Password to verify.
 
+        Unknown usernames and failed legacy plaintext checks still run one
+        scrypt derivation, so response time does not reveal which usernames
+        exist.
+
         Returns:
             True if authentication successful, False otherwise.
         """
         users = self._load_users()
-        for user in users:
-            if user["username"] == username and user["password"] == password:
-                return True
-        return False
+        user = users.get(username)
+        if user is None:
+            hmac.compare_digest(_DUMMY_HASH, _hash_password(password, _DUMMY_SALT))
+            return False
+
+        if "hash" in user:
+            computed = _hash_password(password, bytes.fromhex(user["salt"]))
+            return hmac.compare_digest(bytes.fromhex(user["hash"]), computed)
+
+        # Legacy plaintext record: verify it, then upgrade it to a hash.
+        if not hmac.compare_digest(user["password"].encode(), password.encode()):
+            hmac.compare_digest(_DUMMY_HASH, _hash_password(password, _DUMMY_SALT))
+            return False
+        try:
+            self._save_users({**users, username: self._make_user(username, password)})
+        except OSError:
+            pass  # Not writable; the record is upgraded on a later login.
+        return True
 
     def register_user(self, username: str, password: str) -> bool:
         """Register a new user.
@@ -80,12 +247,11 @@ class AuthManager:
         Returns:
             True if registration successful, False if user already exists.
         """
-        if self.user_exists(username):
+        users = self._load_users()
+        if username in users:
             return False
 
-        users = self._load_users()
-        users.append({"username": username, "password": password})
-        self._save_users(users)
+        self._save_users({**users, username: self._make_user(username, password)})
         return True
 
 
@@ -98,18 +264,20 @@ class App:
         self.current_user: Optional[str] = None
 
     def clear_screen(self) -> None:
-        """Clear the terminal screen."""
-        os.system("clear" if os.name == "posix" else "cls")
+        """Clear the terminal screen.
+
+        POSIX terminals are cleared with ANSI escapes instead of spawning
+        ``clear``; Windows consoles are not guaranteed to honour them.
+        """
+        if os.name == "posix":
+            sys.stdout.write(_CLEAR_SCREEN)
+            sys.stdout.flush()
+        else:
+            os.system("cls")
 
     def display_pre_login_menu(self) -> None:
         """Display the pre-login menu."""
-        print("\n" + "=" * 40)
-        print("  To-Do List Application".center(40))
-        print("=" * 40)
-        print("\n[1] Login")
-        print("[2] Sign Up")
-        print("[3] Exit")
-        print("\n" + "=" * 40)
+        sys.stdout.write(_PRE_LOGIN_MENU)
 
     def handle_login(self) -> bool:
         """Handle user login.
@@ -151,10 +319,6 @@ class App:
             print("Username cannot be empty.")
             return False
 
-        if self.auth_manager.user_exists(username):
-            print("Username already exists. Please choose a different one.")
-            return False
-
         password = input("Enter password: ").strip()
 
         if not password:
@@ -171,7 +335,7 @@ class App:
             print(f"\nAccount created successfully! You can now log in.")
             return False  # Return to menu after successful signup
         else:
-            print("Sign up failed. Please try again.")
+            print("Username already exists. Please choose a different one.")
             return False
 
     def run_pre_login_loop(self) -> bool:
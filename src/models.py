@@ -1,13 +1,13 @@
 """Data models for the To-Do List application."""
 
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
 from datetime import datetime
 from typing import Optional
-import uuid
+import os
 
 
-class Priority(Enum):
+class Priority(StrEnum):
     """Enum for to-do item priority levels."""
 
     HIGH = "HIGH"
@@ -15,19 +15,24 @@ class Priority(Enum):
     LOW = "LOW"
 
 
-class Status(Enum):
+class Status(StrEnum):
     """Enum for to-do item status."""
 
     PENDING = "PENDING"
     COMPLETED = "COMPLETED"
 
 
-@dataclass
+# Value -> member lookups used when deserializing, bypassing Enum.__call__.
+_PRIORITY_BY_VALUE = {priority.value: priority for priority in Priority}
+_STATUS_BY_VALUE = {status.value: status for status in Status}
+
+
+@dataclass(slots=True)
 class TodoItem:
     """Represents a to-do item in the application.
 
     Attributes:
-        id: Unique identifier for the to-do item (UUID).
+        id: Unique identifier for the to-do item (128-bit random hex string).
         title: The title of the to-do item.
         details: Additional details about the to-do item.
         priority: Priority level (HIGH, MID, or LOW).
@@ -42,13 +47,25 @@ class TodoItem:
     priority: Priority
     status: Status
     owner: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    id: str = field(default_factory=lambda: os.urandom(16).hex())
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Fill in missing timestamps from a single clock reading."""
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.now().isoformat()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
 
     def to_dict(self) -> dict:
         """Convert TodoItem to a dictionary for JSON serialization.
 
+        Priority and Status are ``StrEnum`` members, so they are stored as-is
+        and serialize as their string values.
+
         Returns:
             Dictionary representation of the TodoItem.
         """
@@ -56,8 +73,8 @@ class TodoItem:
             "id": self.id,
             "title": self.title,
             "details": self.details,
-            "priority": self.priority.value,
-            "status": self.status.value,
+            "priority": self.priority,
+            "status": self.status,
             "owner": self.owner,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
@@ -67,19 +84,50 @@ class TodoItem:
     def from_dict(cls, data: dict) -> "TodoItem":
         """Create a TodoItem instance from a dictionary.
 
+        The instance is allocated with ``object.__new__`` and its slots are
+        filled directly, skipping ``__init__`` and ``__post_init__``; every
+        field, including both timestamps, comes from ``data``.
+
         Args:
             data: Dictionary containing to-do item data.
 
         Returns:
             TodoItem instance.
+
+        Raises:
+            KeyError: If a required field is missing.
+            ValueError: If the priority or status value is not recognised.
+        """
+        item = object.__new__(cls)
+        item.id = data["id"]
+        item.title = data["title"]
+        item.details = data["details"]
+        priority, status = data["priority"], data["status"]
+        try:
+            item.priority = _PRIORITY_BY_VALUE[priority]
+        except KeyError:
+            raise ValueError(f"{priority!r} is not a valid Priority") from None
+        try:
+            item.status = _STATUS_BY_VALUE[status]
+        except KeyError:
+            raise ValueError(f"{status!r} is not a valid Status") from None
+        item.owner = data["owner"]
+        item.created_at = data["created_at"]
+        item.updated_at = data["updated_at"]
+        return item
+
+    @classmethod
+    def from_list(cls, items: list) -> list:
+        """Create TodoItem instances from a list of dictionaries.
+
+        Equivalent to calling from_dict on each element, with the method
+        bound locally for bulk loading.
+
+        Args:
+            items: List of dictionaries containing to-do item data.
+
+        Returns:
+            List of TodoItem instances.
         """
-        return cls(
-            id=data["id"],
-            title=data["title"],
-            details=data["details"],
-            priority=Priority(data["priority"]),
-            status=Status(data["status"]),
-            owner=data["owner"],
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
-        )
+        from_dict = cls.from_dict
+        return [from_dict(data) for data in items]
@@ -0,0 +1,250 @@
+"""Unit tests for the main module."""
+
+import json
+
+import msgpack
+import pytest
+import src.main
+from src.main import AuthManager
+
+
+def read_users(path):
+    """Decode the MessagePack user list stored at path."""
+    return msgpack.unpackb(path.read_bytes())
+
+
+@pytest.fixture
+def users_file(tmp_path):
+    """Path to a users file inside a temporary directory."""
+    return tmp_path / "users.json"
+
+
+@pytest.fixture
+def legacy_users_file(users_file):
+    """Users file in the old pretty-printed JSON plaintext format."""
+    users_file.write_text(
+        json.dumps([{"username": "alice", "password": "secret"}], indent=2)
+    )
+    return users_file
+
+
+@pytest.fixture
+def hash_calls(monkeypatch):
+    """List of salts passed to _hash_password during the test."""
+    calls = []
+    real_hash = src.main._hash_password
+
+    def counting_hash(password, salt):
+        calls.append(salt)
+        return real_hash(password, salt)
+
+    monkeypatch.setattr(src.main, "_hash_password", counting_hash)
+    return calls
+
+
+class TestAuthManager:
+    """Test cases for the AuthManager class."""
+
+    def test_register_and_authenticate(self, users_file):
+        """Test that a registered user can log in with their password."""
+        auth = AuthManager(str(users_file))
+
+        assert auth.register_user("alice", "secret")
+        assert auth.user_exists("alice")
+        assert auth.authenticate("alice", "secret")
+
+    def test_authenticate_wrong_password(self, users_file):
+        """Test that a wrong password is rejected."""
+        auth = AuthManager(str(users_file))
+        auth.register_user("alice", "secret")
+
+        assert not auth.authenticate("alice", "wrong")
+
+    def test_authenticate_unknown_user(self, users_file):
+        """Test that an unknown username is rejected."""
+        auth = AuthManager(str(users_file))
+
+        assert not auth.authenticate("nobody", "secret")
+
+    def test_authenticate_unknown_user_still_hashes(self, users_file, hash_calls):
+        """Test that rejecting an unknown user costs one password hash."""
+        auth = AuthManager(str(users_file))
+
+        assert not auth.authenticate("nobody", "secret")
+        assert len(hash_calls) == 1
+
+    def test_plaintext_record_wrong_password_still_hashes(
+        self, users_file, hash_calls
+    ):
+        """Test that a failed legacy plaintext check costs one password hash."""
+        users_file.write_bytes(
+            msgpack.packb([{"username": "alice", "password": "secret"}])
+        )
+        auth = AuthManager(str(users_file))
+
+        assert not auth.authenticate("alice", "wrong")
+        assert len(hash_calls) == 1
+
+    def test_register_duplicate_user(self, users_file):
+        """Test that registering an existing username fails."""
+        auth = AuthManager(str(users_file))
+
+        assert auth.register_user("alice", "secret")
+        assert not auth.register_user("alice", "other")
+        assert auth.authenticate("alice", "secret")
+        assert not auth.authenticate("alice", "other")
+
+    def test_register_stores_hash_not_password(self, users_file):
+        """Test that only a salt and hash are written to disk."""
+        auth = AuthManager(str(users_file))
+        auth.register_user("alice", "secret")
+
+        [record] = read_users(users_file)
+        assert set(record) == {"username", "salt", "hash"}
+        assert len(bytes.fromhex(record["salt"])) == 16
+        assert len(bytes.fromhex(record["hash"])) == 32
+        assert b"secret" not in users_file.read_bytes()
+
+    def test_same_password_uses_different_salts(self, users_file):
+        """Test that two users with one password get different hashes."""
+        auth = AuthManager(str(users_file))
+        auth.register_user("alice", "secret")
+        auth.register_user("bob", "secret")
+
+        alice, bob = read_users(users_file)
+        assert alice["salt"] != bob["salt"]
+        assert alice["hash"] != bob["hash"]
+
+    def test_plaintext_record_upgraded_on_login(self, users_file):
+        """Test that a legacy plaintext record is rehashed after login."""
+        users_file.write_bytes(
+            msgpack.packb([{"username": "alice", "password": "secret"}])
+        )
+        auth = AuthManager(str(users_file))
+
+        assert auth.authenticate("alice", "secret")
+
+        [record] = read_users(users_file)
+        assert "password" not in record
+        assert set(record) == {"username", "salt", "hash"}
+        assert AuthManager(str(users_file)).authenticate("alice", "secret")
+
+    def test_plaintext_record_wrong_password_not_upgraded(self, users_file):
+        """Test that a failed login leaves a legacy record untouched."""
+        records = [{"username": "alice", "password": "secret"}]
+        users_file.write_bytes(msgpack.packb(records))
+        auth = AuthManager(str(users_file))
+
+        assert not auth.authenticate("alice", "wrong")
+        assert read_users(users_file) == records
+
+    def test_users_visible_to_second_manager(self, users_file):
+        """Test that a user registered by one manager is seen by another."""
+        first = AuthManager(str(users_file))
+        second = AuthManager(str(users_file))
+        assert not second.user_exists("alice")
+
+        first.register_user("alice", "secret")
+
+        assert second.user_exists("alice")
+        assert second.authenticate("alice", "secret")
+
+    def test_load_binary_header_bytes(self, users_file):
+        """Test that a file whose header contains 0x1A loads completely.
+
+        Only meaningful on Windows, where os.open without O_BINARY stops
+        reading at 0x1A; elsewhere it passes either way.
+        """
+        records = [
+            {"username": f"user{i}", "salt": "00", "hash": "00"} for i in range(26)
+        ]
+        data = msgpack.packb(records)
+        assert data[:3] == b"\xdc\x00\x1a"
+        users_file.write_bytes(data)
+
+        auth = AuthManager(str(users_file))
+
+        assert all(auth.user_exists(f"user{i}") for i in range(26))
+
+    def test_new_file_is_empty_msgpack_list(self, users_file):
+        """Test that a missing users file is created as an empty list."""
+        AuthManager(str(users_file))
+
+        assert read_users(users_file) == []
+
+    def test_empty_file_has_no_users(self, users_file):
+        """Test that an empty users file is treated as having no users."""
+        users_file.write_bytes(b"")
+        auth = AuthManager(str(users_file))
+
+        assert not auth.user_exists("alice")
+        assert auth.register_user("alice", "secret")
+        assert AuthManager(str(users_file)).authenticate("alice", "secret")
+
+
+class TestLegacyJsonMigration:
+    """Test cases for converting JSON users files to MessagePack."""
+
+    def test_legacy_json_authenticates(self, legacy_users_file):
+        """Test that users from a JSON file can still log in."""
+        auth = AuthManager(str(legacy_users_file))
+
+        assert auth.user_exists("alice")
+        assert auth.authenticate("alice", "secret")
+        assert not auth.authenticate("alice", "wrong")
+
+    def test_legacy_json_rewritten_as_msgpack(self, legacy_users_file):
+        """Test that loading a JSON file rewrites it as MessagePack."""
+        auth = AuthManager(str(legacy_users_file))
+        auth.user_exists("alice")
+
+        data = legacy_users_file.read_bytes()
+        assert not data.lstrip().startswith(b"[")
+        assert msgpack.unpackb(data) == [
+            {"username": "alice", "password": "secret"}
+        ]
+
+    def test_legacy_json_survives_reload(self, legacy_users_file):
+        """Test that a migrated file is read back by a second manager."""
+        assert AuthManager(str(legacy_users_file)).authenticate("alice", "secret")
+
+        reloaded = AuthManager(str(legacy_users_file))
+
+        assert reloaded.user_exists("alice")
+        assert reloaded.authenticate("alice", "secret")
+        assert not reloaded.authenticate("alice", "wrong")
+        [record] = read_users(legacy_users_file)
+        assert "password" not in record
+
+    def test_legacy_json_read_only(self, legacy_users_file, monkeypatch):
+        """Test that an unwritable JSON file still allows login."""
+        original = legacy_users_file.read_bytes()
+
+        def deny_replace(src, dst):
+            raise PermissionError("read-only")
+
+        monkeypatch.setattr(src.main.os, "replace", deny_replace)
+        auth = AuthManager(str(legacy_users_file))
+
+        assert auth.user_exists("alice")
+        assert auth.authenticate("alice", "secret")
+        assert not auth.authenticate("alice", "wrong")
+        assert legacy_users_file.read_bytes() == original
+        assert list(legacy_users_file.parent.iterdir()) == [legacy_users_file]
+
+    def test_legacy_json_converted_by_next_save(self, legacy_users_file, monkeypatch):
+        """Test that a failed migration is completed by a later save."""
+        auth = AuthManager(str(legacy_users_file))
+
+        def deny_replace(src, dst):
+            raise PermissionError("read-only")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(src.main.os, "replace", deny_replace)
+            assert auth.user_exists("alice")
+        assert legacy_users_file.read_bytes().lstrip().startswith(b"[")
+
+        assert auth.register_user("bob", "hunter2")
+
+        names = [record["username"] for record in read_users(legacy_users_file)]
+        assert names == ["alice", "bob"]
@@ -1,5 +1,6 @@
 """Unit tests for the models module."""
 
+import json
 import pytest
 from datetime import datetime
 from src.models import TodoItem, Priority, Status
@@ -92,6 +93,18 @@ class TestTodoItem:
         assert len(todo1.id) > 0
         assert len(todo2.id) > 0
 
+    def test_todo_item_default_id_format(self):
+        """Test that the default ID is a 32-character hex string."""
+        todo = TodoItem(
+            title="Todo",
+            details="Details",
+            priority=Priority.HIGH,
+            status=Status.PENDING,
+            owner="user"
+        )
+        assert len(todo.id) == 32
+        int(todo.id, 16)
+
     def test_todo_item_custom_id(self):
         """Test creating a TodoItem with a custom ID."""
         custom_id = "custom-uuid-123"
@@ -127,6 +140,30 @@ class TestTodoItem:
         time_diff = abs((created - updated).total_seconds())
         assert time_diff < 0.001
 
+    def test_todo_item_default_timestamps_match(self):
+        """Test that default created_at and updated_at share one instant."""
+        todo = TodoItem(
+            title="Test Todo",
+            details="Test details",
+            priority=Priority.HIGH,
+            status=Status.PENDING,
+            owner="testuser"
+        )
+        assert todo.created_at == todo.updated_at
+
+    def test_todo_item_partial_timestamps(self):
+        """Test that only the missing timestamp is filled in."""
+        todo = TodoItem(
+            title="Test Todo",
+            details="Test details",
+            priority=Priority.HIGH,
+            status=Status.PENDING,
+            owner="testuser",
+            created_at="2026-01-15T10:00:00"
+        )
+        assert todo.created_at == "2026-01-15T10:00:00"
+        assert datetime.fromisoformat(todo.updated_at) > datetime(2026, 1, 15, 10)
+
     def test_todo_item_to_dict(self):
         """Test converting TodoItem to dictionary."""
         todo = TodoItem(
@@ -150,6 +187,23 @@ class TestTodoItem:
         assert todo_dict["created_at"] == "2026-01-15T10:00:00"
         assert todo_dict["updated_at"] == "2026-01-15T11:00:00"
 
+    def test_todo_item_to_dict_json(self):
+        """Test that the dictionary serializes enums as plain strings."""
+        todo = TodoItem(
+            id="test-123",
+            title="Test Todo",
+            details="Test details",
+            priority=Priority.LOW,
+            status=Status.COMPLETED,
+            owner="testuser",
+            created_at="2026-01-15T10:00:00",
+            updated_at="2026-01-15T11:00:00"
+        )
+        encoded = json.loads(json.dumps(todo.to_dict()))
+
+        assert encoded["priority"] == "LOW"
+        assert encoded["status"] == "COMPLETED"
+
     def test_todo_item_from_dict(self):
         """Test creating TodoItem from dictionary."""
         data = {
@@ -173,6 +227,50 @@ class TestTodoItem:
         assert todo.created_at == "2026-01-10T10:00:00"
         assert todo.updated_at == "2026-01-15T12:00:00"
 
+    def test_todo_item_from_dict_invalid_priority(self):
+        """Test that an unknown priority value is rejected."""
+        data = {
+            "id": "test-456",
+            "title": "Dict Todo",
+            "details": "From dictionary",
+            "priority": "URGENT",
+            "status": "PENDING",
+            "owner": "dictuser",
+            "created_at": "2026-01-10T10:00:00",
+            "updated_at": "2026-01-15T12:00:00"
+        }
+        with pytest.raises(ValueError):
+            TodoItem.from_dict(data)
+
+    def test_todo_item_from_dict_invalid_status(self):
+        """Test that an unknown status value is rejected."""
+        data = {
+            "id": "test-456",
+            "title": "Dict Todo",
+            "details": "From dictionary",
+            "priority": "HIGH",
+            "status": "ARCHIVED",
+            "owner": "dictuser",
+            "created_at": "2026-01-10T10:00:00",
+            "updated_at": "2026-01-15T12:00:00"
+        }
+        with pytest.raises(ValueError):
+            TodoItem.from_dict(data)
+
+    def test_todo_item_from_dict_missing_field(self):
+        """Test that a missing field raises KeyError."""
+        data = {
+            "id": "test-456",
+            "title": "Dict Todo",
+            "details": "From dictionary",
+            "status": "PENDING",
+            "owner": "dictuser",
+            "created_at": "2026-01-10T10:00:00",
+            "updated_at": "2026-01-15T12:00:00"
+        }
+        with pytest.raises(KeyError):
+            TodoItem.from_dict(data)
+
     def test_todo_item_roundtrip_serialization(self):
         """Test that TodoItem can be converted to dict and back."""
         original = TodoItem(
@@ -199,6 +297,29 @@ class TestTodoItem:
         assert restored.created_at == original.created_at
         assert restored.updated_at == original.updated_at
 
+    def test_todo_item_from_list(self):
+        """Test creating several TodoItems from a list of dictionaries."""
+        originals = [
+            TodoItem(
+                id=f"test-{i}",
+                title=f"Todo {i}",
+                details="Bulk load",
+                priority=priority,
+                status=Status.PENDING,
+                owner="bulkuser",
+                created_at="2026-01-12T08:00:00",
+                updated_at="2026-01-12T09:00:00"
+            )
+            for i, priority in enumerate([Priority.HIGH, Priority.MID, Priority.LOW])
+        ]
+        restored = TodoItem.from_list([todo.to_dict() for todo in originals])
+
+        assert restored == originals
+
+    def test_todo_item_from_list_empty(self):
+        """Test that an empty list produces no TodoItems."""
+        assert TodoItem.from_list([]) == []
+
     def test_todo_item_all_priorities(self):
         """Test TodoItem with each priority level."""
         for priority in [Priority.HIGH, Priority.MID, Priority.LOW]:
@@ -223,6 +344,19 @@ class TestTodoItem:
             )
             assert todo.status == status
 
+    def test_todo_item_uses_slots(self):
+        """Test that TodoItem instances have no per-instance __dict__."""
+        todo = TodoItem(
+            title="Test Todo",
+            details="Test details",
+            priority=Priority.HIGH,
+            status=Status.PENDING,
+            owner="testuser"
+        )
+        assert not hasattr(todo, "__dict__")
+        with pytest.raises(AttributeError):
+            todo.unknown_field = "value"
+
     def test_todo_item_empty_title(self):
         """Test creating TodoItem with empty title (should work, validation is elsewhere)."""
         todo = TodoItem(
@@ -0,0 +1,103 @@
+"""Unit tests for the 6688104_Phubase calculator module."""
+
+import importlib.util
+import io
+from pathlib import Path
+
+import pytest
+
+_CALCULATOR_PATH = (
+    Path(__file__).resolve().parent.parent / "6688104_Phubase" / "calculator.py"
+)
+_spec = importlib.util.spec_from_file_location("phubase_calculator", _CALCULATOR_PATH)
+calculator = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(calculator)
+
+
+def run_main(monkeypatch, capsys, script):
+    """Run calculator.main with script piped to stdin and return its output."""
+    monkeypatch.setattr("sys.stdin", io.StringIO(script))
+    calculator.main()
+    return capsys.readouterr().out
+
+
+class TestOperations:
+    """Test cases for the arithmetic functions."""
+
+    def test_divide_by_zero_raises(self):
+        """Test that divide still raises for library callers."""
+        with pytest.raises(ValueError):
+            calculator.divide(1, 0)
+
+
+class TestMain:
+    """Test cases for the interactive main loop."""
+
+    def test_main_each_operation(self, monkeypatch, capsys):
+        """Test a normal result for every operation."""
+        output = run_main(
+            monkeypatch, capsys, "1\n2\n3\n2\n5\n3\n3\n4\n2\n4\n9\n3\n5\n"
+        )
+
+        assert "Result: 2.0 + 3.0 = 5.0" in output
+        assert "Result: 5.0 - 3.0 = 2.0" in output
+        assert "Result: 4.0 × 2.0 = 8.0" in output
+        assert "Result: 9.0 ÷ 3.0 = 3.0" in output
+        assert output.rstrip().endswith("Goodbye!")
+
+    def test_main_invalid_number(self, monkeypatch, capsys):
+        """Test that non-numeric input reports invalid input and continues."""
+        output = run_main(monkeypatch, capsys, "1\nabc\n1\n1\n1\n5\n")
+
+        assert "Invalid input. Please enter valid numbers." in output
+        assert "could not convert" not in output
+        assert "Result: 1.0 + 1.0 = 2.0" in output
+
+    def test_main_divide_by_zero(self, monkeypatch, capsys):
+        """Test that dividing by zero prints an error and continues."""
+        output = run_main(monkeypatch, capsys, "4\n1\n0\n4\n1\n2\n5\n")
+
+        assert "Error: Cannot divide by zero" in output
+        assert "Result: 1.0 ÷ 2.0 = 0.5" in output
+
+    def test_main_invalid_choice(self, monkeypatch, capsys):
+        """Test that an unknown menu choice is rejected."""
+        output = run_main(monkeypatch, capsys, "7\n5\n")
+
+        assert "Invalid choice. Please try again." in output
+
+    def test_main_blank_line(self, monkeypatch, capsys):
+        """Test that a blank line is one invalid answer, as with input()."""
+        output = run_main(monkeypatch, capsys, "1\n\n2\n3\n5\n5\n")
+
+        assert "Invalid input. Please enter valid numbers." in output
+        assert "Result: 3.0 - 5.0 = -2.0" in output
+        assert "Result: 2.0 + 3.0" not in output
+
+    def test_main_line_with_space(self, monkeypatch, capsys):
+        """Test that a line holding two numbers is invalid, not two answers."""
+        output = run_main(monkeypatch, capsys, "1\n2 3\n5\n")
+
+        assert "Invalid input. Please enter valid numbers." in output
+        assert "Result:" not in output
+        assert output.rstrip().endswith("Goodbye!")
+
+    def test_main_reads_stdin_after_banner(self, monkeypatch, capsys):
+        """Test that stdin is only read once the first prompt is shown."""
+
+        class RecordingStdin(io.StringIO):
+            def read(self, *args):
+                self.output_before_read = capsys.readouterr().out
+                return super().read(*args)
+
+        stdin = RecordingStdin("5\n")
+        monkeypatch.setattr("sys.stdin", stdin)
+        calculator.main()
+
+        assert "Simple Calculator" in stdin.output_before_read
+        assert "Enter choice" in stdin.output_before_read
+
+    def test_main_end_of_input(self, monkeypatch, capsys):
+        """Test that running out of piped input raises EOFError like input()."""
+        with pytest.raises(EOFError):
+            run_main(monkeypatch, capsys, "1\n2\n")